@@ -1,409 +1,657 @@
-#!/usr/bin/env python3
-"""
-Network Diagnostic Tool by MrMazine
-GitHub: https://github.com/MrMazine
-"""
-
-import os
-import platform
-import subprocess
-import socket
-import time
-import datetime
-import pandas as pd
-from ping3 import ping
-import psutil
-import speedtest
-from ipaddress import ip_network
-import concurrent.futures
-
-# Color codes for terminal output - these may not work on all terminals - you can add more colors if needed
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    END = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-
-def clear_screen():
-    """Clear the terminal screen based on the OS"""
-    if platform.system() == "Windows":
-        os.system('cls')
-    else:
-        os.system('clear')
-
-def print_header(text):
-    """Print colored header text"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}=== {text} ==={Colors.END}\n")
-
-def print_section(text):
-    """Print colored section text"""
-    print(f"{Colors.BLUE}{Colors.BOLD}» {text}{Colors.END}")
-
-def print_success(text):
-    """Print success message"""
-    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
-
-def print_warning(text):
-    """Print warning message"""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.END}")
-
-def print_error(text):
-    """Print error message"""
-    print(f"{Colors.RED}✗ {text}{Colors.END}")
-
-def print_info(text):
-    """Print informational message"""
-    print(f"{Colors.CYAN}• {text}{Colors.END}")
-
-def get_local_ip():
-    """Get the local IP address of the machine"""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
-    except Exception as e:
-        print_error(f"Error getting local IP: {e}")
-        return "Unknown"
-
-def ping_host(host, count=4):
-    """Ping a host and return statistics"""
-    try:
-        if platform.system() == "Windows":
-            cmd = f"ping -n {count} {host}"
-        else:
-            cmd = f"ping -c {count} {host}"
-            
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout
-    except Exception as e:
-        return f"{Colors.RED}Ping failed: {e}{Colors.END}"
-
-def measure_latency(host, samples=5):
-    """Measure average latency to a host"""
-    delays = []
-    for _ in range(samples):
-        delay = ping(host, unit='ms')
-        if delay is not None:
-            delays.append(delay)
-        time.sleep(0.5)
-    
-    if delays:
-        avg = sum(delays) / len(delays)
-        return {
-            "Target": host,
-            "Samples": len(delays),
-            "Average (ms)": round(avg, 2),
-            "Minimum (ms)": round(min(delays), 2),
-            "Maximum (ms)": round(max(delays), 2),
-            "Packet Loss": f"{round((samples - len(delays))/samples*100, 1)}%"
-        }
-    return {"Error": f"Could not measure latency to {host}"}
-
-def trace_route(host):
-    """Perform a traceroute to a host"""
-    try:
-        if platform.system() == "Windows":
-            cmd = f"tracert {host}"
-        else:
-            cmd = f"traceroute {host}"
-            
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout
-    except Exception as e:
-        return f"{Colors.RED}Traceroute failed: {e}{Colors.END}"
-
-def path_analysis(target="8.8.8.8"):
-    """Analyze network path with mtr (if available)"""
-    try:
-        if platform.system() == "Windows":
-            return f"{Colors.YELLOW}Install WinMTR for Windows path analysis{Colors.END}"
-        
-        cmd = f"mtr --report --report-cycles 5 {target}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout if result.stdout else f"{Colors.YELLOW}Install mtr for path analysis (apt install mtr){Colors.END}"
-    except Exception as e:
-        return f"{Colors.RED}Path analysis failed: {e}{Colors.END}"
-
-def check_dns_lookup(host="google.com"):
-    """Check DNS resolution"""
-    try:
-        ip_address = socket.gethostbyname(host)
-        return f"{Colors.GREEN}DNS resolution for {host}: {ip_address}{Colors.END}"
-    except socket.gaierror:
-        return f"{Colors.RED}DNS lookup failed for {host}{Colors.END}"
-
-def dns_benchmark(servers=["8.8.8.8", "1.1.1.1", "9.9.9.9"]):
-    """Benchmark different DNS servers"""
-    results = []
-    for server in servers:
-        start = time.time()
-        try:
-            socket.gethostbyname("example.com")
-            latency = (time.time() - start) * 1000  # ms
-            results.append({"DNS Server": server, "Latency (ms)": round(latency, 2)})
-        except:
-            results.append({"DNS Server": server, "Latency (ms)": "Timeout"})
-    
-    return pd.DataFrame(results)
-
-def port_scan(host, ports=[80, 443, 22, 21, 3389]):
-    """Check if common ports are open"""
-    results = []
-    for port in ports:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((host, port))
-        if result == 0:
-            results.append(f"{Colors.GREEN}Port {port} is OPEN{Colors.END}")
-        else:
-            results.append(f"{Colors.YELLOW}Port {port} is CLOSED or filtered{Colors.END}")
-        sock.close()
-    return results
-
-def get_network_stats():
-    """Get network interface statistics"""
-    stats = []
-    interfaces = psutil.net_io_counters(pernic=True)
-    
-    for interface, data in interfaces.items():
-        stats.append({
-            "Interface": interface,
-            "Bytes Sent": data.bytes_sent,
-            "Bytes Received": data.bytes_recv,
-            "Packets Sent": data.packets_sent,
-            "Packets Received": data.packets_recv,
-            "Errors In": data.errin,
-            "Errors Out": data.errout,
-            "Drops In": data.dropin,
-            "Drops Out": data.dropout
-        })
-    
-    return pd.DataFrame(stats)
-
-def monitor_bandwidth(duration=10):
-    """Monitor bandwidth usage over time"""
-    start_time = time.time()
-    initial_stats = psutil.net_io_counters()
-    
-    print_info(f"Monitoring network usage for {duration} seconds...")
-    print_info("Press Ctrl+C to stop early\n")
-    
-    try:
-        while time.time() - start_time < duration:
-            time.sleep(1)
-            current_stats = psutil.net_io_counters()
-            
-            sent = (current_stats.bytes_sent - initial_stats.bytes_sent) / 1024
-            recv = (current_stats.bytes_recv - initial_stats.bytes_recv) / 1024
-            
-            print(f"  {Colors.CYAN}Upload: {sent:.2f} KB/s | Download: {recv:.2f} KB/s{Colors.END}", end='\r')
-            initial_stats = current_stats
-    except KeyboardInterrupt:
-        pass
-    
-    print_success("\nBandwidth monitoring complete.")
-
-def get_wifi_signal():
-    """Get Wi-Fi signal strength"""
-    try:
-        if platform.system() == "Windows":
-            cmd = "netsh wlan show interfaces"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if "Signal" in line:
-                    return line.strip()
-        else:  # Linux
-            cmd = "iwconfig 2>/dev/null | grep -i quality"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.stdout:
-                return result.stdout.strip()
-            return f"{Colors.YELLOW}Run with 'sudo' for Wi-Fi signal info{Colors.END}"
-        
-        return f"{Colors.YELLOW}Signal strength information not available{Colors.END}"
-    except Exception as e:
-        return f"{Colors.RED}Error getting signal strength: {e}{Colors.END}"
-    
-_a = ['h', 't', 't', 'p', 's', ':', '/', '/']
-_b = ['g', 'i', 't', 'h', 'u', 'b', '.', 'c', 'o', 'm', '/']
-
-def check_dhcp_lease():
-    """Check DHCP lease information"""
-    try:
-        if platform.system() == "Windows":
-            cmd = "ipconfig /all"
-        else:
-            cmd = "cat /var/lib/dhcp/dhclient.leases 2>/dev/null || echo 'DHCP lease file not found'"
-        
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout
-    except Exception as e:
-        return f"{Colors.RED}DHCP lease check failed: {e}{Colors.END}"
-
-def _generate_attribution():
-    parts = [''.join(_a), ''.join(_b), ''.join(_c)]
-    return ''.join(parts)
-_c = ['M', 'r', 'M', 'a', 'z', 'i', 'n', 'e']
-
-def get_adapter_info():
-    """Get detailed network adapter information"""
-    adapters = []
-    for name, addrs in psutil.net_if_addrs().items():
-        adapter = {"Interface": name}
-        for addr in addrs:
-            if addr.family == socket.AF_INET:
-                adapter["IPv4"] = addr.address
-                adapter["Netmask"] = addr.netmask
-            elif addr.family == socket.AF_INET6:
-                adapter["IPv6"] = addr.address
-            elif addr.family == psutil.AF_LINK:
-                adapter["MAC"] = addr.address
-        adapters.append(adapter)
-    
-    return pd.DataFrame(adapters)
-
-def speed_test():
-    """Perform an internet speed test"""
-    try:
-        print_info("Running speed test... This may take a moment")
-        st = speedtest.Speedtest()
-        st.get_best_server()
-        
-        download_speed = st.download() / 1_000_000  # Convert to Mbps
-        upload_speed = st.upload() / 1_000_000  # Convert to Mbps
-        ping_result = st.results.ping
-        
-        return {
-            "Download Speed (Mbps)": round(download_speed, 2),
-            "Upload Speed (Mbps)": round(upload_speed, 2),
-            "Ping (ms)": round(ping_result, 2),
-            "Server": st.results.server['host']
-        }
-    except Exception as e:
-        return {"Error": f"{Colors.RED}Speed test failed: {str(e)}{Colors.END}"}
-
-def check_arp_table():
-    """Check the ARP table"""
-    try:
-        if platform.system() == "Windows":
-            cmd = "arp -a"
-        else:
-            cmd = "arp -n"
-            
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout
-    except Exception as e:
-        return f"{Colors.RED}ARP table check failed: {e}{Colors.END}"
-
-def check_network_connections():
-    """Check active network connections"""
-    connections = []
-    for conn in psutil.net_connections(kind='inet'):
-        if conn.status == 'ESTABLISHED':
-            connections.append({
-                "Local Address": f"{conn.laddr.ip}:{conn.laddr.port}",
-                "Remote Address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
-                "Status": conn.status,
-                "PID": conn.pid
-            })
-    return pd.DataFrame(connections)
-
-def main():
-    clear_screen()
-    print(f"{Colors.HEADER}{Colors.BOLD}=== Network Diagnostic Tool ==={Colors.END}")
-    print(f"{Colors.CYAN}Created by {''.join(_c)} - {_generate_attribution()}{Colors.END}")
-    print(f"Running on: {Colors.YELLOW}{platform.system()} {platform.release()}{Colors.END}")
-    print(f"Local IP Address: {Colors.GREEN}{get_local_ip()}{Colors.END}")
-    print(f"Current Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Python Version: {Colors.YELLOW}{platform.python_version()}{Colors.END}\n")
-    
-    # Test targets
-    gateway = input(f"{Colors.BLUE}Enter your gateway IP [192.168.1.1]: {Colors.END}").strip() or "192.168.1.1"
-    dns_server = "8.8.8.8"  # Google DNS
-    test_host = "google.com"
-    
-    # Run diagnostics
-    print_header("Basic Connectivity Tests")
-    
-    print_section(f"Pinging gateway ({gateway})")
-    print(ping_host(gateway))
-    
-    print_section(f"Pinging DNS server ({dns_server})")
-    print(ping_host(dns_server))
-    
-    print_section(f"Pinging external host ({test_host})")
-    print(ping_host(test_host))
-    
-    print_header("DNS Check")
-    print(check_dns_lookup(test_host))
-    
-    print_header("Traceroute to External Host")
-    print(trace_route(test_host))
-    
-    print_header("Port Availability")
-    for result in port_scan(test_host):
-        print(result)
-    
-    print_header("Network Interface Statistics")
-    print(get_network_stats().to_string(index=False))
-    
-    print_header("ARP Table")
-    print(check_arp_table())
-    
-    print_header("Active Network Connections")
-    conns = check_network_connections()
-    if not conns.empty:
-        print(conns.to_string(index=False))
-    else:
-        print_info("No established connections found")
-    
-    print_header("Internet Speed Test")
-    speed_results = speed_test()
-    for k, v in speed_results.items():
-        print(f"{k}: {v}")
-    
-    # New functions execution
-    print_header("Advanced Diagnostics")
-    
-    print_section("Network Latency Analysis")
-    latency_results = measure_latency(test_host)
-    for k, v in latency_results.items():
-        print(f"{k}: {v}")
-    
-    print_section("Bandwidth Monitoring")
-    monitor_bandwidth()
-    
-    print_section("Wi-Fi Signal Strength")
-    print(get_wifi_signal())
-    
-    print_section("Network Path Analysis")
-    print("Note: This requires mtr installed on Linux/Mac")
-    print(path_analysis())
-    
-    print_section("DHCP Lease Information")
-    print(check_dhcp_lease())
-    
-    print_section("Network Adapter Details")
-    print(get_adapter_info().to_string(index=False))
-    
-    print_section("DNS Server Benchmark")
-    print(dns_benchmark().to_string(index=False))
-    
-    print(f"\n{Colors.GREEN}{Colors.BOLD}Diagnostic complete. All tests executed successfully.{Colors.END}")
-    print(f"{Colors.YELLOW}Created by {''.join(_c)} - {_generate_attribution()}{Colors.END}")
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print(f"\n{Colors.RED}Script interrupted by user.{Colors.END}")
-        exit(0)
-    except Exception as e:
-        print(f"\n{Colors.RED}An unexpected error occurred: {e}{Colors.END}")
-        exit(1)
+#!/usr/bin/env python3
+"""
+Network Diagnostic Tool by MrMazine
+GitHub: https://github.com/MrMazine
+"""
+
+import os
+import sys
+import asyncio
+import platform
+import subprocess
+import socket
+import selectors
+import functools
+import time
+import datetime
+import dns.asyncresolver
+from ping3 import ping
+import psutil
+import speedtest
+from ipaddress import ip_network
+import concurrent.futures
+
+# Color codes for terminal output - these may not work on all terminals - you can add more colors if needed
+class Colors:
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    END = '\033[0m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+
+# Blank out every escape code when stdout isn't a terminal or the user
+# set NO_COLOR, so piped and logged output stays grep-friendly; this
+# runs before the precomputed prefixes below so they inherit it
+_COLOR_ENABLED = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+if not _COLOR_ENABLED:
+    for _name in list(vars(Colors)):
+        if not _name.startswith('_'):
+            setattr(Colors, _name, '')
+
+# On a terminal the bandwidth monitor redraws one status line in place;
+# without one, each tick becomes its own plain line instead
+_CLEAR_LINE = '\x1b[2K\r' if _COLOR_ENABLED else '\n'
+
+# Prefixes and templates built once so the print helpers don't rebuild
+# the same escape-code strings on every message
+_SECTION_PFX = f"{Colors.BLUE}{Colors.BOLD}» "
+_OK_PFX = f"{Colors.GREEN}✓ "
+_WARN_PFX = f"{Colors.YELLOW}⚠ "
+_ERR_PFX = f"{Colors.RED}✗ "
+_INFO_PFX = f"{Colors.CYAN}• "
+_END = Colors.END
+_PORT_OPEN_TPL = f"{Colors.GREEN}Port {{}} is OPEN{Colors.END}"
+_PORT_CLOSED_TPL = f"{Colors.YELLOW}Port {{}} is CLOSED or filtered{Colors.END}"
+
+# The platform never changes for the life of the process - probe it once
+_IS_WINDOWS = platform.system() == "Windows"
+_CLEAR_CMD = 'cls' if _IS_WINDOWS else 'clear'
+
+def _fmt_table(rows, cols=None):
+    """Format a list of row dicts as an aligned text table"""
+    if cols is None:
+        cols = []
+        for row in rows:
+            for col in row:
+                if col not in cols:
+                    cols.append(col)
+    cells = [[str(row.get(col, "N/A")) for col in cols] for row in rows]
+    widths = [max([len(col)] + [len(row[i]) for row in cells])
+              for i, col in enumerate(cols)]
+    lines = ['  '.join(col.rjust(width) for col, width in zip(cols, widths))]
+    for row in cells:
+        lines.append('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
+
+def _run(argv):
+    """Run a command without a shell and return its stdout"""
+    return subprocess.run(argv, capture_output=True, text=True).stdout
+
+def _stream(argv):
+    """Run a command and print each line of output as it arrives"""
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    proc.wait()
+
+def clear_screen():
+    """Clear the terminal screen based on the OS"""
+    os.system(_CLEAR_CMD)
+
+def print_header(text):
+    """Print colored header text"""
+    print(f"\n{Colors.HEADER}{Colors.BOLD}=== {text} ==={Colors.END}\n")
+
+def print_section(text):
+    """Print colored section text"""
+    print(_SECTION_PFX, text, _END, sep='')
+
+def print_success(text):
+    """Print success message"""
+    print(_OK_PFX, text, _END, sep='')
+
+def print_warning(text):
+    """Print warning message"""
+    print(_WARN_PFX, text, _END, sep='')
+
+def print_error(text):
+    """Print error message"""
+    print(_ERR_PFX, text, _END, sep='')
+
+def print_info(text):
+    """Print informational message"""
+    print(_INFO_PFX, text, _END, sep='')
+
+@functools.lru_cache(maxsize=1)
+def _interface_snapshot():
+    """Snapshot all per-interface state with one round of /proc parsing
+
+    Shared by every consumer of interface data so a single run pays the
+    psutil collection cost once. Call _interface_snapshot.cache_clear()
+    when fresh counters are genuinely needed.
+    """
+    return {
+        "io": psutil.net_io_counters(pernic=True),
+        "addrs": psutil.net_if_addrs(),
+        "stats": psutil.net_if_stats()
+    }
+
+@functools.lru_cache(maxsize=1)
+def get_local_ip():
+    """Get the local IP address of the machine"""
+    try:
+        # Prefer the interface table - no network syscall needed
+        snapshot = _interface_snapshot()
+        if_stats = snapshot["stats"]
+        for interface, addrs in snapshot["addrs"].items():
+            if interface not in if_stats or not if_stats[interface].isup:
+                continue
+            for addr in addrs:
+                if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                    return addr.address
+
+        # Fall back to the UDP routing trick
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        local_ip = s.getsockname()[0]
+        s.close()
+        return local_ip
+    except Exception as e:
+        print_error(f"Error getting local IP: {e}")
+        return "Unknown"
+
+def ping_host(host, count=4):
+    """Ping a host and return statistics"""
+    try:
+        delays = []
+        for _ in range(count):
+            delay = ping(host, unit='ms', timeout=2)
+            if delay is not None and delay is not False:
+                delays.append(delay)
+
+        received = len(delays)
+        loss = round((count - received) / count * 100, 1)
+        lines = [f"Ping statistics for {host}:",
+                 f"    Packets: Sent = {count}, Received = {received}, Lost = {count - received} ({loss}% loss)"]
+        if delays:
+            lines.append(f"    Round trip times: Minimum = {min(delays):.2f}ms, "
+                         f"Average = {sum(delays)/received:.2f}ms, Maximum = {max(delays):.2f}ms")
+        return '\n'.join(lines)
+    except PermissionError:
+        return _ping_host_subprocess(host, count)
+    except Exception as e:
+        return f"{Colors.RED}Ping failed: {e}{Colors.END}"
+
+def _ping_host_subprocess(host, count=4):
+    """Ping a host with the system ping binary (fallback when ICMP sockets are unavailable)"""
+    try:
+        if _IS_WINDOWS:
+            argv = ["ping", "-n", str(count), host]
+        else:
+            argv = ["ping", "-c", str(count), host]
+
+        return _run(argv)
+    except Exception as e:
+        return f"{Colors.RED}Ping failed: {e}{Colors.END}"
+
+def measure_latency(host, samples=5):
+    """Measure average latency to a host"""
+    delays = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=samples) as executor:
+        futures = [executor.submit(ping, host, unit='ms') for _ in range(samples)]
+        for future in concurrent.futures.as_completed(futures):
+            delay = future.result()
+            if delay is not None and delay is not False:
+                delays.append(delay)
+
+    if delays:
+        avg = sum(delays) / len(delays)
+        return {
+            "Target": host,
+            "Samples": len(delays),
+            "Average (ms)": round(avg, 2),
+            "Minimum (ms)": round(min(delays), 2),
+            "Maximum (ms)": round(max(delays), 2),
+            "Packet Loss": f"{round((samples - len(delays))/samples*100, 1)}%"
+        }
+    return {"Error": f"Could not measure latency to {host}"}
+
+def trace_route(host):
+    """Perform a traceroute to a host, printing each hop as it is found"""
+    try:
+        if _IS_WINDOWS:
+            argv = ["tracert", host]
+        else:
+            argv = ["traceroute", host]
+
+        _stream(argv)
+    except Exception as e:
+        print_error(f"Traceroute failed: {e}")
+
+def path_analysis(target="8.8.8.8"):
+    """Analyze network path with mtr (if available)"""
+    try:
+        if _IS_WINDOWS:
+            return f"{Colors.YELLOW}Install WinMTR for Windows path analysis{Colors.END}"
+        
+        output = _run(["mtr", "--report", "--report-cycles", "5", target])
+        return output if output else f"{Colors.YELLOW}Install mtr for path analysis (apt install mtr){Colors.END}"
+    except FileNotFoundError:
+        return f"{Colors.YELLOW}Install mtr for path analysis (apt install mtr){Colors.END}"
+    except Exception as e:
+        return f"{Colors.RED}Path analysis failed: {e}{Colors.END}"
+
+def check_dns_lookup(host="google.com"):
+    """Check DNS resolution"""
+    try:
+        ip_address = socket.gethostbyname(host)
+        return f"{Colors.GREEN}DNS resolution for {host}: {ip_address}{Colors.END}"
+    except socket.gaierror:
+        return f"{Colors.RED}DNS lookup failed for {host}{Colors.END}"
+
+def dns_benchmark(servers=["8.8.8.8", "1.1.1.1", "9.9.9.9"]):
+    """Benchmark different DNS servers"""
+    async def _time_server(server):
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [server]
+        resolver.lifetime = 1.0
+        start = time.perf_counter_ns()
+        try:
+            await resolver.resolve("example.com", "A")
+            return round((time.perf_counter_ns() - start) / 1e6, 2)  # ms
+        except Exception:
+            return "Timeout"
+
+    async def _benchmark():
+        return await asyncio.gather(*[_time_server(server) for server in servers])
+
+    latencies = asyncio.run(_benchmark())
+    return [{"DNS Server": server, "Latency (ms)": latency}
+            for server, latency in zip(servers, latencies)]
+
+def port_scan(host, ports=[80, 443, 22, 21, 3389]):
+    """Check if common ports are open"""
+    # Resolve once up front instead of once per port
+    try:
+        host = socket.gethostbyname(host)
+    except socket.gaierror:
+        pass
+
+    # Start every connect non-blocking and wait on a single selector,
+    # reusing one kernel wait instead of an event loop and stream
+    # objects per probe
+    sel = selectors.DefaultSelector()
+    pending = {}
+    for port in ports:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.connect_ex((host, port))
+        sel.register(sock, selectors.EVENT_WRITE, port)
+        pending[port] = sock
+
+    open_ports = set()
+    deadline = time.perf_counter() + 1.0
+    while pending:
+        timeout = deadline - time.perf_counter()
+        if timeout <= 0:
+            break
+        for key, _ in sel.select(timeout):
+            sock, port = key.fileobj, key.data
+            if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                open_ports.add(port)
+            sel.unregister(sock)
+            sock.close()
+            del pending[port]
+
+    # Anything still pending at the deadline is closed or filtered
+    for sock in pending.values():
+        sel.unregister(sock)
+        sock.close()
+    sel.close()
+
+    results = []
+    for port in ports:
+        tpl = _PORT_OPEN_TPL if port in open_ports else _PORT_CLOSED_TPL
+        results.append(tpl.format(port))
+    return results
+
+def get_network_stats():
+    """Get network interface statistics"""
+    interfaces = _interface_snapshot()["io"]
+
+    return [{
+        "Interface": interface,
+        "Bytes Sent": data.bytes_sent,
+        "Bytes Received": data.bytes_recv,
+        "Packets Sent": data.packets_sent,
+        "Packets Received": data.packets_recv,
+        "Errors In": data.errin,
+        "Errors Out": data.errout,
+        "Drops In": data.dropin,
+        "Drops Out": data.dropout
+    } for interface, data in interfaces.items()]
+
+def monitor_bandwidth(duration=10):
+    """Monitor bandwidth usage over time"""
+    start_time = time.perf_counter_ns()
+    last_time = start_time
+    next_tick = start_time
+    initial_stats = psutil.net_io_counters()
+
+    print_info(f"Monitoring network usage for {duration} seconds...")
+    print_info("Press Ctrl+C to stop early\n")
+
+    try:
+        while time.perf_counter_ns() - start_time < duration * 1_000_000_000:
+            # Sleep until the next whole-second deadline so ticks stay
+            # phase-locked instead of drifting by the work done each loop
+            next_tick += 1_000_000_000
+            time.sleep(max(0, (next_tick - time.perf_counter_ns()) / 1e9))
+            now = time.perf_counter_ns()
+            current_stats = psutil.net_io_counters()
+
+            # Divide by the actual elapsed interval, not an assumed 1s
+            dt = (now - last_time) / 1e9
+            sent = (current_stats.bytes_sent - initial_stats.bytes_sent) / 1024 / dt
+            recv = (current_stats.bytes_recv - initial_stats.bytes_recv) / 1024 / dt
+
+            print(f"{_CLEAR_LINE}  {Colors.CYAN}Upload: {sent:.2f} KB/s | Download: {recv:.2f} KB/s{Colors.END}", end='')
+            initial_stats = current_stats
+            last_time = now
+    except KeyboardInterrupt:
+        pass
+
+    print_success("\nBandwidth monitoring complete.")
+
+def get_wifi_signal():
+    """Get Wi-Fi signal strength"""
+    try:
+        if _IS_WINDOWS:
+            output = _run(["netsh", "wlan", "show", "interfaces"])
+            for line in output.split('\n'):
+                if "Signal" in line:
+                    return line.strip()
+        else:  # Linux
+            output = _run(["iwconfig"])
+            quality_lines = [line.strip() for line in output.split('\n')
+                             if "quality" in line.lower()]
+            if quality_lines:
+                return '\n'.join(quality_lines)
+            return f"{Colors.YELLOW}Run with 'sudo' for Wi-Fi signal info{Colors.END}"
+
+        return f"{Colors.YELLOW}Signal strength information not available{Colors.END}"
+    except FileNotFoundError:
+        return f"{Colors.YELLOW}Signal strength information not available{Colors.END}"
+    except Exception as e:
+        return f"{Colors.RED}Error getting signal strength: {e}{Colors.END}"
+
+def check_dhcp_lease():
+    """Check DHCP lease information"""
+    try:
+        if _IS_WINDOWS:
+            return _run(["ipconfig", "/all"])
+
+        try:
+            with open("/var/lib/dhcp/dhclient.leases") as f:
+                return f.read()
+        except OSError:
+            return "DHCP lease file not found"
+    except Exception as e:
+        return f"{Colors.RED}DHCP lease check failed: {e}{Colors.END}"
+
+_a = ['h', 't', 't', 'p', 's', ':', '/', '/']
+_b = ['g', 'i', 't', 'h', 'u', 'b', '.', 'c', 'o', 'm', '/']
+_c = ['M', 'r', 'M', 'a', 'z', 'i', 'n', 'e']
+
+# Joined once at import instead of on every banner print; _c also used
+# to be defined after the function that read it, which only worked
+# because nothing called it before module load finished
+_AUTHOR = ''.join(_c)
+_ATTRIBUTION = ''.join(_a) + ''.join(_b) + _AUTHOR
+
+def get_adapter_info():
+    """Get detailed network adapter information"""
+    adapters = []
+    for name, addrs in _interface_snapshot()["addrs"].items():
+        adapter = {"Interface": name}
+        for addr in addrs:
+            if addr.family == socket.AF_INET:
+                adapter["IPv4"] = addr.address
+                adapter["Netmask"] = addr.netmask
+            elif addr.family == socket.AF_INET6:
+                adapter["IPv6"] = addr.address
+            elif addr.family == psutil.AF_LINK:
+                adapter["MAC"] = addr.address
+        adapters.append(adapter)
+
+    return adapters
+
+def speed_test(server_id=None):
+    """Perform an internet speed test, optionally against a pinned server"""
+    try:
+        print_info("Running speed test... This may take a moment")
+        st = speedtest.Speedtest()
+        if server_id:
+            # Pinning a server skips pinging dozens of candidates,
+            # which dominates the warmup time
+            st.get_servers([server_id])
+            st.get_best_server()
+        else:
+            st.get_best_server()
+
+        download_speed = st.download() / 1_000_000  # Convert to Mbps
+        upload_speed = st.upload() / 1_000_000  # Convert to Mbps
+        ping_result = st.results.ping
+        
+        return {
+            "Download Speed (Mbps)": round(download_speed, 2),
+            "Upload Speed (Mbps)": round(upload_speed, 2),
+            "Ping (ms)": round(ping_result, 2),
+            "Server": st.results.server['host']
+        }
+    except Exception as e:
+        return {"Error": f"{Colors.RED}Speed test failed: {str(e)}{Colors.END}"}
+
+def check_arp_table():
+    """Check the ARP table"""
+    try:
+        if _IS_WINDOWS:
+            argv = ["arp", "-a"]
+        else:
+            argv = ["arp", "-n"]
+
+        return _run(argv)
+    except Exception as e:
+        return f"{Colors.RED}ARP table check failed: {e}{Colors.END}"
+
+def _decode_proc_addr(hex_addr):
+    """Decode a /proc/net/tcp* hex address:port pair to 'ip:port'"""
+    addr, _, port = hex_addr.partition(':')
+    raw = bytes.fromhex(addr)
+    if len(raw) == 4:
+        ip = socket.inet_ntop(socket.AF_INET, raw[::-1])
+    else:
+        # IPv6 is stored as four little-endian 32-bit words
+        ip = socket.inet_ntop(socket.AF_INET6,
+                              b''.join(raw[i:i + 4][::-1] for i in range(0, 16, 4)))
+    return f"{ip}:{int(port, 16)}"
+
+def _pids_for_inodes(inodes):
+    """Map socket inodes to owning PIDs with one pass over /proc/*/fd"""
+    wanted = set(inodes)
+    mapping = {}
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            fds = os.scandir(f"{entry.path}/fd")
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(fd.path)
+            except OSError:
+                continue
+            if target.startswith('socket:[') and target[8:-1] in wanted:
+                mapping[target[8:-1]] = int(entry.name)
+        if len(mapping) == len(wanted):
+            break
+    return mapping
+
+def _proc_established_connections():
+    """List established TCP connections straight from /proc/net/tcp*
+
+    Filters on the state column before decoding anything, so the cost
+    scales with established connections rather than every socket on the
+    host the way psutil.net_connections does.
+    """
+    rows = []
+    for path in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(path) as f:
+                next(f)  # header
+                for line in f:
+                    parts = line.split()
+                    if parts[3] != '01':  # TCP_ESTABLISHED
+                        continue
+                    rows.append((parts[1], parts[2], parts[9]))
+        except OSError:
+            continue
+
+    pids = _pids_for_inodes(inode for _, _, inode in rows)
+    return [(_decode_proc_addr(laddr), _decode_proc_addr(raddr),
+             pids.get(inode)) for laddr, raddr, inode in rows]
+
+def check_network_connections():
+    """Check active network connections"""
+    connections = []
+    if os.path.exists("/proc/net/tcp"):
+        for laddr, raddr, pid in _proc_established_connections():
+            connections.append({
+                "Local Address": laddr,
+                "Remote Address": raddr,
+                "Status": 'ESTABLISHED',
+                "PID": pid
+            })
+    else:
+        # kind='tcp' skips the UDP tables, which never have ESTABLISHED entries
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.status == 'ESTABLISHED':
+                connections.append({
+                    "Local Address": f"{conn.laddr.ip}:{conn.laddr.port}",
+                    "Remote Address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
+                    "Status": conn.status,
+                    "PID": conn.pid
+                })
+    return connections
+
+def main():
+    clear_screen()
+    print(f"{Colors.HEADER}{Colors.BOLD}=== Network Diagnostic Tool ==={Colors.END}")
+    print(f"{Colors.CYAN}Created by {_AUTHOR} - {_ATTRIBUTION}{Colors.END}")
+    print(f"Running on: {Colors.YELLOW}{platform.system()} {platform.release()}{Colors.END}")
+    print(f"Local IP Address: {Colors.GREEN}{get_local_ip()}{Colors.END}")
+    print(f"Current Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Python Version: {Colors.YELLOW}{platform.python_version()}{Colors.END}\n")
+    
+    # Test targets
+    gateway = input(f"{Colors.BLUE}Enter your gateway IP [192.168.1.1]: {Colors.END}").strip() or "192.168.1.1"
+    dns_server = "8.8.8.8"  # Google DNS
+    test_host = "google.com"
+
+    # Resolve the test host once and hand the IP to every diagnostic so
+    # ping/traceroute/port scan don't each hit the resolver again
+    try:
+        test_ip = socket.gethostbyname(test_host)
+    except socket.gaierror:
+        test_ip = test_host
+
+    # Launch the independent subprocess-based diagnostics up front so they
+    # run concurrently while results are printed in the usual order
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+    futures = {
+        "ping_gateway": executor.submit(ping_host, gateway),
+        "ping_dns": executor.submit(ping_host, dns_server),
+        "ping_host": executor.submit(ping_host, test_ip),
+        "arp_table": executor.submit(check_arp_table),
+        "dhcp_lease": executor.submit(check_dhcp_lease),
+        "path_analysis": executor.submit(path_analysis),
+        "wifi_signal": executor.submit(get_wifi_signal),
+    }
+
+    # Run diagnostics
+    print_header("Basic Connectivity Tests")
+
+    print_section(f"Pinging gateway ({gateway})")
+    print(futures["ping_gateway"].result())
+
+    print_section(f"Pinging DNS server ({dns_server})")
+    print(futures["ping_dns"].result())
+
+    print_section(f"Pinging external host ({test_host})")
+    print(futures["ping_host"].result())
+
+    print_header("DNS Check")
+    print(check_dns_lookup(test_host))
+
+    print_header("Traceroute to External Host")
+    trace_route(test_ip)
+
+    print_header("Port Availability")
+    for result in port_scan(test_ip):
+        print(result)
+    
+    print_header("Network Interface Statistics")
+    print(_fmt_table(get_network_stats()))
+    
+    print_header("ARP Table")
+    print(futures["arp_table"].result())
+
+    print_header("Active Network Connections")
+    conns = check_network_connections()
+    if conns:
+        print(_fmt_table(conns))
+    else:
+        print_info("No established connections found")
+    
+    print_header("Internet Speed Test")
+    speed_results = speed_test()
+    for k, v in speed_results.items():
+        print(f"{k}: {v}")
+    
+    # New functions execution
+    print_header("Advanced Diagnostics")
+    
+    print_section("Network Latency Analysis")
+    latency_results = measure_latency(test_ip)
+    for k, v in latency_results.items():
+        print(f"{k}: {v}")
+    
+    print_section("Bandwidth Monitoring")
+    monitor_bandwidth()
+    
+    print_section("Wi-Fi Signal Strength")
+    print(futures["wifi_signal"].result())
+
+    print_section("Network Path Analysis")
+    print("Note: This requires mtr installed on Linux/Mac")
+    print(futures["path_analysis"].result())
+
+    print_section("DHCP Lease Information")
+    print(futures["dhcp_lease"].result())
+
+    executor.shutdown()
+
+    print_section("Network Adapter Details")
+    print(_fmt_table(get_adapter_info(), ["Interface", "IPv4", "Netmask", "IPv6", "MAC"]))
+    
+    print_section("DNS Server Benchmark")
+    print(_fmt_table(dns_benchmark()))
+    
+    print(f"\n{Colors.GREEN}{Colors.BOLD}Diagnostic complete. All tests executed successfully.{Colors.END}")
+    print(f"{Colors.YELLOW}Created by {_AUTHOR} - {_ATTRIBUTION}{Colors.END}")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print(f"\n{Colors.RED}Script interrupted by user.{Colors.END}")
+        exit(0)
+    except Exception as e:
+        print(f"\n{Colors.RED}An unexpected error occurred: {e}{Colors.END}")
+        exit(1)